@@ -1,5 +1,6 @@
 """Code Humanizer package."""
 
-__all__ = ["__version__"]
-__version__ = "0.1.0"
+from .scanner import Scanner
 
+__all__ = ["Scanner", "__version__"]
+__version__ = "0.1.0"
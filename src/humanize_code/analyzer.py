@@ -1,67 +1,213 @@
 from __future__ import annotations
 
 import ast
+import re
+import time
+from bisect import bisect_right
 from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
-from .models import FileReport, Issue
+from .models import DiscoveryStats, FileReport, Issue
 from .rules import (
     DEFAULT_EXTENSIONS,
     DEFAULT_EXCLUDED_DIRS,
     DEFAULT_TEST_DIRS,
     GENERIC_IDENTIFIER_NAMES,
+    JS_FUNC_MULTILINE_PATTERN,
     JS_FUNC_PATTERN,
     LOW_SIGNAL_COMMENT_PATTERNS,
+    MAX_SCORE,
+    PY_BARE_EXCEPT_MULTILINE_PATTERN,
     PY_BARE_EXCEPT_PATTERN,
+    PY_BROAD_EXCEPT_MULTILINE_PATTERN,
     PY_BROAD_EXCEPT_PATTERN,
+    PY_FUNC_OR_CLASS_MULTILINE_PATTERN,
     PY_FUNC_OR_CLASS_PATTERN,
     SEVERITY_WEIGHT,
+    TODO_COMMENT_MULTILINE_PATTERN,
     TODO_COMMENT_PATTERN,
 )
 
+JS_SUFFIXES = {".js", ".jsx", ".ts", ".tsx"}
+BATCH_MAX_FILE_CHARS = 4096
+BATCH_MAX_FILES = 256
+# str.splitlines() breaks on these too, but re.MULTILINE anchors only see "\n".
+_EXTRA_LINE_BREAKS = re.compile("[\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]")
+
 
 def iter_source_files(
     paths: list[Path],
     extensions: set[str] | None = None,
     include_tests: bool = False,
     excluded_dirs: set[str] | None = None,
+    stats: DiscoveryStats | None = None,
 ) -> list[Path]:
+    exts, skip_dirs = normalize_discovery_config(extensions, excluded_dirs)
+    return discover_source_files(paths, exts, skip_dirs, include_tests=include_tests, stats=stats)
+
+
+def normalize_discovery_config(
+    extensions: set[str] | None = None,
+    excluded_dirs: set[str] | None = None,
+) -> tuple[set[str], set[str]]:
+    """Apply defaults and return lower-cased ``(extensions, excluded_dirs)`` for discovery."""
     exts = _normalize_extensions(extensions or DEFAULT_EXTENSIONS)
     skip_dirs = _normalize_dirs(excluded_dirs or DEFAULT_EXCLUDED_DIRS)
-    discovered: list[Path] = []
+    return exts, skip_dirs
+
+
+def discover_source_files(
+    paths: list[Path],
+    exts: set[str],
+    skip_dirs: set[str],
+    include_tests: bool = False,
+    stats: DiscoveryStats | None = None,
+) -> list[Path]:
+    """Like ``iter_source_files`` but takes sets from ``normalize_discovery_config``."""
+    skipped: set[Path] = set()
+    found = sorted(set(walk_source_files(paths, exts, skip_dirs, include_tests=include_tests, skipped=skipped)))
+    if stats is not None:
+        stats.skipped = len(skipped)
+        stats.discovered = len(found) + stats.skipped
+    return found
+
+
+def walk_source_files(
+    paths: list[Path],
+    exts: set[str],
+    skip_dirs: set[str],
+    include_tests: bool = False,
+    skipped: set[Path] | None = None,
+) -> Iterator[Path]:
+    """Yield source files lazily in walk order, so a caller can stop discovery early.
+
+    Files may repeat when ``paths`` overlap. Excluded candidates are added to
+    ``skipped`` when it is given.
+    """
     for path in paths:
         if path.is_file():
-            if path.suffix.lower() in exts and not _should_skip_file(
-                path, include_tests=include_tests, excluded_dirs=skip_dirs
-            ):
-                discovered.append(path)
+            candidates: Iterable[Path] = [path] if path.suffix.lower() in exts else []
+        elif path.is_dir():
+            candidates = (file for file in path.rglob("*") if _is_candidate_source_file(file, exts))
+        else:
             continue
-        if path.is_dir():
-            for file in path.rglob("*"):
-                if _is_candidate_source_file(file, exts) and not _should_skip_file(
-                    file, include_tests=include_tests, excluded_dirs=skip_dirs
-                ):
-                    discovered.append(file)
-    return sorted(set(discovered))
+        for file in candidates:
+            if _should_skip_file(file, include_tests=include_tests, excluded_dirs=skip_dirs):
+                if skipped is not None:
+                    skipped.add(file)
+            else:
+                yield file
 
 
 def analyze_file(path: Path) -> FileReport:
-    text = path.read_text(encoding="utf-8", errors="ignore")
+    text, size = _read_source(path)
     issues = analyze_text(text, suffix=path.suffix.lower())
     score = calculate_score(issues)
-    return FileReport(path=str(path), score=score, issues=issues)
+    return FileReport(path=str(path), score=score, issues=issues, size=size)
+
+
+def _read_source(path: Path) -> tuple[str, int]:
+    # Same text as read_text(errors="ignore"), plus the byte count metrics need without a second stat.
+    data = path.read_bytes()
+    text = data.decode("utf-8", errors="ignore").replace("\r\n", "\n").replace("\r", "\n")
+    return text, len(data)
+
+
+def iter_file_reports(paths: list[Path], deadline: float | None = None) -> Iterator[FileReport]:
+    """Yield one report per path, in order, batching small files through ``analyze_texts``.
+
+    With a ``deadline`` (a ``time.monotonic()`` value) no file is read and no
+    batch is analyzed once it has passed, so every yielded report is work
+    done within the budget.
+    """
+    pending: list[tuple[Path, str, int]] = []
+
+    def expired() -> bool:
+        return deadline is not None and time.monotonic() >= deadline
+
+    def flush() -> Iterator[FileReport]:
+        if expired():
+            pending.clear()
+            return
+        batched = analyze_texts([(text, path.suffix.lower()) for path, text, _ in pending])
+        for (path, _, size), issues in zip(pending, batched):
+            yield FileReport(path=str(path), score=calculate_score(issues), issues=issues, size=size)
+        pending.clear()
+
+    for path in paths:
+        if expired():
+            break
+        text, size = _read_source(path)
+        if len(text) > BATCH_MAX_FILE_CHARS:
+            yield from flush()
+            if expired():
+                break
+            issues = analyze_text(text, suffix=path.suffix.lower())
+            yield FileReport(path=str(path), score=calculate_score(issues), issues=issues, size=size)
+            continue
+        pending.append((path, text, size))
+        if len(pending) >= BATCH_MAX_FILES:
+            yield from flush()
+    yield from flush()
 
 
 def analyze_text(text: str, suffix: str = "") -> list[Issue]:
     lines = text.splitlines()
+    return _assemble_issues(
+        text,
+        lines,
+        suffix,
+        generic_names=_find_generic_names(lines, suffix),
+        broad_exceptions=_find_broad_exceptions(lines, suffix),
+        todo_markers=_find_todo_markers(lines),
+    )
+
+
+def analyze_texts(items: list[tuple[str, str]]) -> list[list[Issue]]:
+    """Analyze many ``(text, suffix)`` pairs; equal to calling ``analyze_text`` on each.
+
+    The line-regex rules run once over the joined texts instead of once per
+    line per file, which is where the time goes for many tiny files.
+    """
+    results: list[list[Issue] | None] = [None] * len(items)
+    batchable: list[int] = []
+    for index, (text, suffix) in enumerate(items):
+        if _EXTRA_LINE_BREAKS.search(text):
+            results[index] = analyze_text(text, suffix=suffix)
+        else:
+            batchable.append(index)
+
+    findings = _find_line_rules_batched([items[index] for index in batchable])
+    for index, (generic_names, broad_exceptions, todo_markers) in zip(batchable, findings):
+        text, suffix = items[index]
+        results[index] = _assemble_issues(
+            text,
+            text.splitlines(),
+            suffix,
+            generic_names=generic_names,
+            broad_exceptions=broad_exceptions,
+            todo_markers=todo_markers,
+        )
+    return results
+
+
+def _assemble_issues(
+    text: str,
+    lines: list[str],
+    suffix: str,
+    generic_names: list[Issue],
+    broad_exceptions: list[Issue],
+    todo_markers: list[Issue],
+) -> list[Issue]:
     issues: list[Issue] = []
 
-    issues.extend(_find_generic_names(lines, suffix))
-    issues.extend(_find_broad_exceptions(lines, suffix))
+    issues.extend(generic_names)
+    issues.extend(broad_exceptions)
     issues.extend(_find_low_signal_comments(lines))
     issues.extend(_find_deep_nesting(lines, suffix))
     issues.extend(_find_duplicate_blocks(lines))
-    issues.extend(_find_todo_markers(lines))
+    issues.extend(todo_markers)
 
     if suffix == ".py":
         issues.extend(_find_long_python_functions(text))
@@ -82,7 +228,86 @@ def analyze_text(text: str, suffix: str = "") -> list[Issue]:
 
 def calculate_score(issues: list[Issue]) -> int:
     score = sum(SEVERITY_WEIGHT.get(issue.severity, 0) for issue in issues[:20])
-    return min(score, 100)
+    return min(score, MAX_SCORE)
+
+
+def _find_line_rules_batched(
+    items: list[tuple[str, str]],
+) -> list[tuple[list[Issue], list[Issue], list[Issue]]]:
+    """Run the generic-name, broad-except and TODO rules over all ``items`` at once.
+
+    Texts are joined newline-terminated, Python files first and JS files
+    next, so the language-specific patterns scan one contiguous slice each.
+    A match offset maps to its file by bisecting the start offsets, and to
+    its line by counting newlines from the previous match in that pass.
+    """
+    order = sorted(range(len(items)), key=lambda index: _batch_group(items[index][1]))
+    parts: list[str] = []
+    starts: list[int] = []
+    first_lines: list[int] = []
+    offset = 0
+    line = 1
+    for index in order:
+        text = items[index][0]
+        if text and not text.endswith("\n"):
+            text += "\n"
+        starts.append(offset)
+        first_lines.append(line)
+        parts.append(text)
+        offset += len(text)
+        line += text.count("\n")
+    buffer = "".join(parts)
+
+    group_bounds: dict[int, list[int]] = {}
+    for position, index in enumerate(order):
+        group = _batch_group(items[index][1])
+        bounds = group_bounds.setdefault(group, [starts[position], starts[position]])
+        bounds[1] = starts[position] + len(parts[position])
+
+    generic_names: list[list[Issue]] = [[] for _ in items]
+    broad_exceptions: list[list[Issue]] = [[] for _ in items]
+    todo_markers: list[list[Issue]] = [[] for _ in items]
+
+    def locate(matches: Iterator[re.Match[str]]) -> Iterator[tuple[int, int, re.Match[str]]]:
+        cursor = 0
+        cursor_line = 1
+        for match in matches:
+            cursor_line += buffer.count("\n", cursor, match.start())
+            cursor = match.start()
+            position = bisect_right(starts, cursor) - 1
+            yield order[position], cursor_line - first_lines[position] + 1, match
+
+    for index, line_number, _ in locate(TODO_COMMENT_MULTILINE_PATTERN.finditer(buffer)):
+        todo_markers[index].append(_todo_issue(line_number))
+
+    if 0 in group_bounds:
+        begin, end = group_bounds[0]
+        for index, line_number, match in locate(PY_FUNC_OR_CLASS_MULTILINE_PATTERN.finditer(buffer, begin, end)):
+            if match.group(2).lower() in GENERIC_IDENTIFIER_NAMES:
+                generic_names[index].append(_generic_name_issue(match.group(2), line_number))
+        for index, line_number, _ in locate(PY_BARE_EXCEPT_MULTILINE_PATTERN.finditer(buffer, begin, end)):
+            broad_exceptions[index].append(_broad_exception_issue(bare=True, line=line_number))
+        for index, line_number, _ in locate(PY_BROAD_EXCEPT_MULTILINE_PATTERN.finditer(buffer, begin, end)):
+            broad_exceptions[index].append(_broad_exception_issue(bare=False, line=line_number))
+        for findings in broad_exceptions:
+            findings.sort(key=lambda issue: issue.line)
+
+    if 1 in group_bounds:
+        begin, end = group_bounds[1]
+        for index, line_number, match in locate(JS_FUNC_MULTILINE_PATTERN.finditer(buffer, begin, end)):
+            name = match.group(1) or match.group(2)
+            if name.lower() in GENERIC_IDENTIFIER_NAMES:
+                generic_names[index].append(_generic_name_issue(name, line_number))
+
+    return list(zip(generic_names, broad_exceptions, todo_markers))
+
+
+def _batch_group(suffix: str) -> int:
+    if suffix == ".py":
+        return 0
+    if suffix in JS_SUFFIXES:
+        return 1
+    return 2
 
 
 def _find_generic_names(lines: list[str], suffix: str) -> list[Issue]:
@@ -91,52 +316,56 @@ def _find_generic_names(lines: list[str], suffix: str) -> list[Issue]:
         if suffix == ".py":
             match = PY_FUNC_OR_CLASS_PATTERN.match(line)
             name = match.group(2) if match else None
-        elif suffix in {".js", ".jsx", ".ts", ".tsx"}:
+        elif suffix in JS_SUFFIXES:
             match = JS_FUNC_PATTERN.match(line)
             name = (match.group(1) or match.group(2)) if match else None
         else:
             name = None
         if name and name.lower() in GENERIC_IDENTIFIER_NAMES:
-            findings.append(
-                Issue(
-                    code="GENERIC_NAME",
-                    severity="medium",
-                    line=index,
-                    message=f"Generic identifier '{name}' hides domain intent.",
-                    suggestion="Rename using task-specific domain terms.",
-                )
-            )
+            findings.append(_generic_name_issue(name, index))
     return findings
 
 
+def _generic_name_issue(name: str, line: int) -> Issue:
+    return Issue(
+        code="GENERIC_NAME",
+        severity="medium",
+        line=line,
+        message=f"Generic identifier '{name}' hides domain intent.",
+        suggestion="Rename using task-specific domain terms.",
+    )
+
+
 def _find_broad_exceptions(lines: list[str], suffix: str) -> list[Issue]:
     if suffix != ".py":
         return []
     findings: list[Issue] = []
     for index, line in enumerate(lines, start=1):
         if PY_BARE_EXCEPT_PATTERN.match(line):
-            findings.append(
-                Issue(
-                    code="BARE_EXCEPT",
-                    severity="high",
-                    line=index,
-                    message="Bare except catches everything and hides failure mode.",
-                    suggestion="Catch explicit exception types and handle intentionally.",
-                )
-            )
+            findings.append(_broad_exception_issue(bare=True, line=index))
         elif PY_BROAD_EXCEPT_PATTERN.match(line):
-            findings.append(
-                Issue(
-                    code="BROAD_EXCEPTION",
-                    severity="medium",
-                    line=index,
-                    message="Over-broad exception handling reduces observability.",
-                    suggestion="Catch narrower exception classes and preserve context.",
-                )
-            )
+            findings.append(_broad_exception_issue(bare=False, line=index))
     return findings
 
 
+def _broad_exception_issue(bare: bool, line: int) -> Issue:
+    if bare:
+        return Issue(
+            code="BARE_EXCEPT",
+            severity="high",
+            line=line,
+            message="Bare except catches everything and hides failure mode.",
+            suggestion="Catch explicit exception types and handle intentionally.",
+        )
+    return Issue(
+        code="BROAD_EXCEPTION",
+        severity="medium",
+        line=line,
+        message="Over-broad exception handling reduces observability.",
+        suggestion="Catch narrower exception classes and preserve context.",
+    )
+
+
 def _find_low_signal_comments(lines: list[str]) -> list[Issue]:
     findings: list[Issue] = []
     for index, line in enumerate(lines, start=1):
@@ -240,18 +469,20 @@ def _find_todo_markers(lines: list[str]) -> list[Issue]:
     findings: list[Issue] = []
     for index, line in enumerate(lines, start=1):
         if TODO_COMMENT_PATTERN.search(line):
-            findings.append(
-                Issue(
-                    code="TODO_MARKER",
-                    severity="low",
-                    line=index,
-                    message="TODO/FIXME marker left in source.",
-                    suggestion="Resolve it or create a tracked issue reference.",
-                )
-            )
+            findings.append(_todo_issue(index))
     return findings
 
 
+def _todo_issue(line: int) -> Issue:
+    return Issue(
+        code="TODO_MARKER",
+        severity="low",
+        line=line,
+        message="TODO/FIXME marker left in source.",
+        suggestion="Resolve it or create a tracked issue reference.",
+    )
+
+
 def _find_long_python_functions(text: str) -> list[Issue]:
     findings: list[Issue] = []
     try:
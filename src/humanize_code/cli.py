@@ -1,14 +1,31 @@
 from __future__ import annotations
 
 import argparse
-import difflib
 import json
+import math
+import os
 import sys
+import time
+from collections import Counter
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from functools import partial
 from pathlib import Path
 
-from .analyzer import analyze_file, iter_source_files, summarize_severity
-from .models import FileReport, Issue
-from .rewriter import rewrite_file
+from .analyzer import (
+    analyze_file,
+    iter_file_reports,
+    iter_source_files,
+    normalize_discovery_config,
+    summarize_severity,
+    walk_source_files,
+)
+from .metrics import ScanMetrics, write_metrics
+from .models import DiscoveryStats, FileReport, Issue, RewriteResult
+from .rewriter import rewrite_file, unified_diff
+from .sampling import SampleDesign, estimate_scan, parse_sample_spec, stratified_sample
+from .scheduling import load_prior_scores, order_by_risk
 from .rules import DEFAULT_EXTENSIONS, SEVERITY_ORDER
 
 
@@ -39,6 +56,50 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Include test files in analysis (excluded by default).",
     )
+    scan_parser.add_argument(
+        "--metrics-out",
+        metavar="FILE",
+        default=None,
+        help="Write scan metrics (counts, score histogram, phase timings, peak RSS) to FILE.",
+    )
+    scan_parser.add_argument(
+        "--metrics-format",
+        choices=["openmetrics", "json"],
+        default=None,
+        help="Metrics file format (default: json for .json files, otherwise openmetrics).",
+    )
+    coverage_group = scan_parser.add_mutually_exclusive_group()
+    coverage_group.add_argument(
+        "--sample",
+        type=_sample_spec,
+        metavar="N|PCT%",
+        default=None,
+        help="Analyze a stratified random sample (file count or percentage) and report estimates.",
+    )
+    scan_parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Random seed for --sample (default: 0).",
+    )
+    coverage_group.add_argument(
+        "--time-budget",
+        type=float,
+        metavar="SECONDS",
+        default=None,
+        help="Analyze highest-risk files first and stop at the deadline, reporting partial coverage.",
+    )
+    coverage_group.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="With --fail-on, stop at the first issue at or above the threshold, print it, and exit 2.",
+    )
+    scan_parser.add_argument(
+        "--prior-report",
+        metavar="FILE",
+        default=None,
+        help="Earlier 'scan --json' output whose scores rank files under --time-budget.",
+    )
 
     rewrite_parser = subparsers.add_parser("rewrite", help="Preview or apply safe rewrites.")
     rewrite_parser.add_argument("paths", nargs="+", help="File or directory paths.")
@@ -55,6 +116,12 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Include test files in rewrite pass (excluded by default).",
     )
+    rewrite_parser.add_argument(
+        "--jobs",
+        type=_non_negative_int,
+        default=1,
+        help="Rewrite files in N worker processes; 0 uses one per CPU (default: 1).",
+    )
     return parser
 
 
@@ -63,6 +130,20 @@ def main(argv: list[str] | None = None) -> int:
     args = parser.parse_args(argv)
 
     if args.command == "scan":
+        if args.fail_fast and args.fail_on == "none":
+            parser.error("--fail-fast requires --fail-on")
+        if args.time_budget is not None and not (math.isfinite(args.time_budget) and args.time_budget >= 0):
+            parser.error("--time-budget must be a finite, non-negative number of seconds")
+        args.prior_scores = None
+        if args.prior_report:
+            if args.time_budget is None:
+                parser.error("--prior-report requires --time-budget")
+            try:
+                args.prior_scores = load_prior_scores(Path(args.prior_report))
+            except (OSError, ValueError) as error:
+                parser.error(f"cannot read --prior-report {args.prior_report}: {error}")
+        if args.fail_fast:
+            return run_scan_fail_fast(args)
         return run_scan(args)
     if args.command == "rewrite":
         return run_rewrite(args)
@@ -71,55 +152,266 @@ def main(argv: list[str] | None = None) -> int:
 
 
 def run_scan(args: argparse.Namespace) -> int:
+    started = time.monotonic()
+    metrics = ScanMetrics()
     paths = [Path(item) for item in args.paths]
     extensions = set(args.extensions) if args.extensions else DEFAULT_EXTENSIONS
-    files = iter_source_files(paths, extensions=extensions, include_tests=args.include_tests)
-    reports = [analyze_file(path) for path in files]
-    reports = [report for report in reports if report.issues]
-
-    if args.json:
-        payload = {
-            "file_count": len(files),
-            "flagged_file_count": len(reports),
-            "reports": [report.to_dict() for report in reports],
-        }
-        print(json.dumps(payload, indent=2))
-    else:
-        _print_human_scan(files, reports)
+    with metrics.phase("discover"):
+        discovery = DiscoveryStats()
+        files = iter_source_files(paths, extensions=extensions, include_tests=args.include_tests, stats=discovery)
+    metrics.record_discovery(discovery)
+
+    deadline = None
+    design: SampleDesign | None = None
+    queue = files
+    if args.sample is not None:
+        design = stratified_sample(files, args.sample, seed=args.seed)
+        queue = design.files
+    elif args.time_budget is not None:
+        deadline = started + args.time_budget
+        queue = order_by_risk(files, args.prior_scores)
+
+    reports: list[FileReport] = []
+    sampled_reports: list[FileReport] = []
+    analyzed: set[Path] = set()
+    with metrics.phase("analyze"):
+        for report in iter_file_reports(queue, deadline=deadline):
+            path = Path(report.path)
+            analyzed.add(path)
+            metrics.record_report(report, size=report.size)
+            if design is not None:
+                sampled_reports.append(report)
+            if report.issues:
+                reports.append(report)
+    if deadline is not None:
+        reports.sort(key=lambda report: report.path)
+    partial = len(analyzed) < len(files)
+    estimates = estimate_scan(design, sampled_reports) if design is not None else None
+
+    with metrics.phase("report"):
+        if args.json:
+            payload: dict[str, object] = {
+                "file_count": len(analyzed),
+                "flagged_file_count": len(reports),
+                "reports": [report.to_dict() for report in reports],
+            }
+            if deadline is not None or design is not None:
+                payload["partial"] = partial
+                payload["coverage"] = _coverage(len(analyzed), len(files))
+            if deadline is not None:
+                payload["unanalyzed_files"] = [str(path) for path in files if path not in analyzed]
+            if design is not None:
+                payload["sample"] = {"seed": design.seed, "strata": len(design.population)}
+                payload["estimates"] = estimates
+            print(json.dumps(payload, indent=2))
+        else:
+            if deadline is not None:
+                _print_coverage(len(analyzed), len(files), partial, args.time_budget)
+            if design is not None:
+                _print_estimates(design, len(analyzed), estimates)
+            _print_human_scan(len(analyzed), reports)
+
+    _write_metrics(args, metrics)
 
     if args.fail_on != "none" and _has_severity_at_or_above(reports, args.fail_on):
         return 2
     return 0
 
 
+def run_scan_fail_fast(args: argparse.Namespace) -> int:
+    """Discover and analyze one file at a time, stopping at the first gating issue.
+
+    Discovery is lazy and unsorted, so nothing past the first hit is walked
+    or read. Without a hit the answer is the same as a full ``--fail-on`` scan.
+    """
+    metrics = ScanMetrics()
+    paths = [Path(item) for item in args.paths]
+    extensions, skip_dirs = normalize_discovery_config(set(args.extensions) if args.extensions else None)
+    threshold = SEVERITY_ORDER[args.fail_on]
+    skipped: set[Path] = set()
+    seen: set[Path] = set()
+    offending: tuple[FileReport, Issue] | None = None
+
+    with metrics.phase("analyze"):
+        files = walk_source_files(
+            paths, extensions, skip_dirs, include_tests=args.include_tests, skipped=skipped
+        )
+        for path in files:
+            if path in seen:
+                continue
+            seen.add(path)
+            report = analyze_file(path)
+            metrics.record_report(report, size=report.size)
+            gating = [issue for issue in report.issues if SEVERITY_ORDER.get(issue.severity, 0) >= threshold]
+            if gating:
+                offending = (report, min(gating, key=lambda issue: issue.line or 0))
+                break
+    metrics.record_discovery(DiscoveryStats(discovered=len(seen) + len(skipped), skipped=len(skipped)))
+
+    with metrics.phase("report"):
+        if args.json:
+            payload: dict[str, object] = {"file_count": len(seen), "failed": offending is not None}
+            if offending is not None:
+                report, issue = offending
+                payload["finding"] = {"path": report.path, **issue.to_dict()}
+            print(json.dumps(payload, indent=2))
+        elif offending is not None:
+            report, issue = offending
+            print(f"Stopped after {len(seen)} files at first {args.fail_on}+ issue:")
+            print(f"{report.path}  slop_score={report.score}")
+            print(_format_issue(issue))
+        else:
+            print(f"Scanned files: {len(seen)}")
+            print(f"No issues at or above {args.fail_on}.")
+
+    _write_metrics(args, metrics)
+    return 2 if offending is not None else 0
+
+
 def run_rewrite(args: argparse.Namespace) -> int:
     paths = [Path(item) for item in args.paths]
     extensions = set(args.extensions) if args.extensions else DEFAULT_EXTENSIONS
-    files = iter_source_files(paths, extensions=extensions, include_tests=args.include_tests)
+    files = _unique_targets(iter_source_files(paths, extensions=extensions, include_tests=args.include_tests))
 
-    changed_reports = []
-    for path in files:
-        report = rewrite_file(path, apply=args.apply)
-        if report.changed:
-            changed_reports.append(report)
-            mode = "applied" if args.apply else "preview"
-            print(f"[{mode}] {report.path} ({report.change_count} safe changes)")
-            if args.diff:
-                diff = difflib.unified_diff(
-                    report.original.splitlines(),
-                    report.rewritten.splitlines(),
-                    fromfile=f"{report.path}:before",
-                    tofile=f"{report.path}:after",
-                    lineterm="",
-                )
-                print("\n".join(diff))
-    if not changed_reports:
+    jobs = args.jobs or os.cpu_count() or 1
+    job = partial(_rewrite_job, apply=args.apply, diff=args.diff)
+
+    started = time.perf_counter()
+    if jobs > 1 and len(files) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            chunksize = max(1, len(files) // (jobs * 8))
+            tally = _emit_rewrites(executor.map(job, files, chunksize=chunksize), apply=args.apply)
+    else:
+        tally = _emit_rewrites(map(job, files), apply=args.apply)
+    elapsed = time.perf_counter() - started
+
+    if not tally["changed"] and not tally["stale"] and not tally["failed"]:
         print("No safe rewrites were necessary.")
-    return 0
+    rate = max(elapsed, 1e-9)
+    verb = "Rewrote" if args.apply else "Would rewrite"
+    summary = (
+        f"{verb} {tally['changed']}/{len(files)} files ({tally['changes']} safe changes) in {elapsed:.2f}s: "
+        f"{len(files) / rate:.1f} files/s, {tally['changes'] / rate:.1f} changes/s"
+    )
+    if tally["stale"]:
+        summary += f"; skipped {tally['stale']} modified during rewrite"
+    if tally["failed"]:
+        summary += f"; {tally['failed']} failed"
+    print(summary)
+    return 1 if tally["failed"] else 0
+
+
+def _unique_targets(files: list[Path]) -> list[Path]:
+    # A symlink and its target are one file; rewriting both would report the second as stale.
+    seen: set[str] = set()
+    unique: list[Path] = []
+    for path in files:
+        target = os.path.realpath(path)
+        if target not in seen:
+            seen.add(target)
+            unique.append(path)
+    return unique
+
+
+def _rewrite_job(path: Path, apply: bool, diff: bool) -> tuple[RewriteResult, list[str]]:
+    try:
+        report = rewrite_file(path, apply=apply)
+    except Exception as error:
+        # Reported per file so one bad path cannot abort the rest of a parallel run.
+        message = str(error) if isinstance(error, OSError) else f"{type(error).__name__}: {error}"
+        failed = RewriteResult(path=str(path), changed=False, original="", rewritten="", change_count=0, error=message)
+        return failed, []
+    diff_lines: list[str] = []
+    if diff and report.changed:
+        diff_lines = list(
+            unified_diff(
+                report.original,
+                report.edits,
+                fromfile=f"{report.path}:before",
+                tofile=f"{report.path}:after",
+            )
+        )
+    # The texts never leave the job, so workers return only what gets printed.
+    return replace(report, original="", rewritten="", edits=[]), diff_lines
+
+
+def _emit_rewrites(results: Iterable[tuple[RewriteResult, list[str]]], apply: bool) -> Counter[str]:
+    tally: Counter[str] = Counter()
+    for report, diff_lines in results:
+        if report.error is not None:
+            tally["failed"] += 1
+            print(f"[error] {report.path} ({report.error})")
+            continue
+        if not report.changed:
+            continue
+        if report.stale:
+            tally["stale"] += 1
+            print(f"[skipped] {report.path} (modified since it was read)")
+            continue
+        tally["changed"] += 1
+        tally["changes"] += report.change_count
+        mode = "applied" if apply else "preview"
+        print(f"[{mode}] {report.path} ({report.change_count} safe changes)")
+        sys.stdout.writelines(f"{line}\n" for line in diff_lines)
+    return tally
+
+
+def _write_metrics(args: argparse.Namespace, metrics: ScanMetrics) -> None:
+    # A failed metrics write must not mask the --fail-on exit code of the scan itself.
+    if not args.metrics_out:
+        return
+    try:
+        write_metrics(metrics, Path(args.metrics_out), fmt=args.metrics_format)
+    except OSError as error:
+        print(f"error: cannot write --metrics-out {args.metrics_out}: {error}", file=sys.stderr)
+
+
+def _sample_spec(value: str) -> float | int:
+    try:
+        return parse_sample_spec(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error)) from error
+
+
+def _non_negative_int(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"expected a non-negative integer, got {value}")
+    return number
+
+
+def _coverage(analyzed: int, total: int) -> dict[str, object]:
+    return {
+        "analyzed_files": analyzed,
+        "total_files": total,
+        "ratio": round(analyzed / total, 4) if total else 1.0,
+    }
+
+
+def _print_coverage(analyzed: int, total: int, partial: bool, budget: float) -> None:
+    ratio = _coverage(analyzed, total)["ratio"]
+    status = f"partial, {budget:g}s time budget exhausted" if partial else "complete"
+    print(f"Coverage: {analyzed}/{total} files ({ratio:.1%}), {status}")
+
+
+def _print_estimates(design: SampleDesign, analyzed: int, estimates: dict[str, object]) -> None:
+    print(
+        f"Sampled files: {analyzed}/{design.population_size} "
+        f"({len(design.population)} strata, seed {design.seed}); estimates with 95% CI:"
+    )
+    print(f"  mean slop_score: {_format_estimate(estimates['mean_score'])}")
+    print(f"  flagged file ratio: {_format_estimate(estimates['flagged_file_ratio'])}")
+    for severity, estimate in estimates["issues_per_file"].items():
+        print(f"  {severity} issues per file: {_format_estimate(estimate)}")
+    print("")
+
+
+def _format_estimate(estimate: dict[str, float]) -> str:
+    return f"{estimate['estimate']:.3f} [{estimate['ci95_low']:.3f}, {estimate['ci95_high']:.3f}]"
 
 
-def _print_human_scan(files: list[Path], reports: list[FileReport]) -> None:
-    print(f"Scanned files: {len(files)}")
+def _print_human_scan(file_count: int, reports: list[FileReport]) -> None:
+    print(f"Scanned files: {file_count}")
     print(f"Flagged files: {len(reports)}")
     severity_totals = _summarize_reports(reports)
     if severity_totals:
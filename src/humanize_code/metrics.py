@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import json
+import sys
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .analyzer import summarize_severity
+from .models import DiscoveryStats, FileReport
+from .rewriter import write_text_atomic
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+METRIC_PREFIX = "code_humanizer"
+SCORE_BUCKETS: tuple[int, ...] = (0, 10, 25, 50, 75, 100)
+
+
+@dataclass
+class ScanMetrics:
+    files_discovered: int = 0
+    files_skipped: int = 0
+    files_analyzed: int = 0
+    files_flagged: int = 0
+    bytes_read: int = 0
+    issues_by_code: Counter[str] = field(default_factory=Counter)
+    issues_by_severity: Counter[str] = field(default_factory=Counter)
+    score_buckets: list[int] = field(default_factory=lambda: [0] * len(SCORE_BUCKETS))
+    score_sum: int = 0
+    phase_seconds: dict[str, float] = field(default_factory=dict)
+
+    def record_discovery(self, stats: DiscoveryStats) -> None:
+        self.files_discovered = stats.discovered
+        self.files_skipped = stats.skipped
+
+    def record_report(self, report: FileReport, size: int) -> None:
+        self.files_analyzed += 1
+        self.bytes_read += size
+        if report.issues:
+            self.files_flagged += 1
+        self.issues_by_code.update(issue.code for issue in report.issues)
+        self.issues_by_severity.update(summarize_severity(report.issues))
+        self.score_sum += report.score
+        for index, bound in enumerate(SCORE_BUCKETS):
+            if report.score <= bound:
+                self.score_buckets[index] += 1
+                break
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_seconds[name] = self.phase_seconds.get(name, 0.0) + time.perf_counter() - started
+
+    def to_dict(self) -> dict[str, object]:
+        cumulative = 0
+        histogram: dict[str, int] = {}
+        for bound, count in zip(SCORE_BUCKETS, self.score_buckets):
+            cumulative += count
+            histogram[str(bound)] = cumulative
+        return {
+            "files": {
+                "discovered": self.files_discovered,
+                "skipped": self.files_skipped,
+                "analyzed": self.files_analyzed,
+                "flagged": self.files_flagged,
+            },
+            "bytes_read": self.bytes_read,
+            "issues_by_code": dict(sorted(self.issues_by_code.items())),
+            "issues_by_severity": dict(sorted(self.issues_by_severity.items())),
+            "score_histogram": {
+                "buckets": histogram,
+                "count": self.files_analyzed,
+                "sum": self.score_sum,
+            },
+            "phase_seconds": dict(self.phase_seconds),
+            "peak_rss_bytes": peak_rss_bytes(),
+        }
+
+
+def peak_rss_bytes() -> int | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def render_json(metrics: ScanMetrics) -> str:
+    return json.dumps(metrics.to_dict(), indent=2) + "\n"
+
+
+def render_openmetrics(metrics: ScanMetrics) -> str:
+    data = metrics.to_dict()
+    lines: list[str] = []
+
+    def family(name: str, kind: str, help_text: str, unit: str | None = None) -> str:
+        full_name = f"{METRIC_PREFIX}_{name}"
+        lines.append(f"# TYPE {full_name} {kind}")
+        if unit:
+            lines.append(f"# UNIT {full_name} {unit}")
+        lines.append(f"# HELP {full_name} {help_text}")
+        return full_name
+
+    name = family("files", "gauge", "Source files by scan outcome.")
+    for state, count in data["files"].items():
+        lines.append(f'{name}{{state="{state}"}} {count}')
+
+    name = family("read_bytes", "gauge", "Bytes of source read for analysis.", unit="bytes")
+    lines.append(f"{name} {metrics.bytes_read}")
+
+    name = family("issues_by_code", "gauge", "Issues found, by rule code.")
+    for code, count in data["issues_by_code"].items():
+        lines.append(f'{name}{{code="{_escape_label(code)}"}} {count}')
+
+    name = family("issues_by_severity", "gauge", "Issues found, by severity.")
+    for severity, count in data["issues_by_severity"].items():
+        lines.append(f'{name}{{severity="{_escape_label(severity)}"}} {count}')
+
+    name = family("file_score", "histogram", "Per-file slop score of analyzed files.")
+    for bound, count in data["score_histogram"]["buckets"].items():
+        lines.append(f'{name}_bucket{{le="{float(bound)}"}} {count}')
+    lines.append(f'{name}_bucket{{le="+Inf"}} {metrics.files_analyzed}')
+    lines.append(f"{name}_count {metrics.files_analyzed}")
+    lines.append(f"{name}_sum {metrics.score_sum}")
+
+    name = family("phase_duration_seconds", "gauge", "Wall time spent in each scan phase.", unit="seconds")
+    for phase, seconds in data["phase_seconds"].items():
+        lines.append(f'{name}{{phase="{_escape_label(phase)}"}} {seconds:.6f}')
+
+    peak = data["peak_rss_bytes"]
+    if peak is not None:
+        name = family("peak_rss_bytes", "gauge", "Peak resident set size of the scan process.", unit="bytes")
+        lines.append(f"{name} {peak}")
+
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def write_metrics(metrics: ScanMetrics, path: Path, fmt: str | None = None) -> None:
+    """Write ``metrics`` atomically so a textfile collector never reads a partial file."""
+    if fmt is None:
+        fmt = "json" if path.suffix.lower() == ".json" else "openmetrics"
+    payload = render_json(metrics) if fmt == "json" else render_openmetrics(metrics)
+    write_text_atomic(path, payload)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
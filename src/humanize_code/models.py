@@ -20,6 +20,8 @@ class FileReport:
     path: str
     score: int
     issues: list[Issue] = field(default_factory=list)
+    # Bytes read from disk for this report; not part of the serialized report.
+    size: int = field(default=0, compare=False)
 
     def to_dict(self) -> dict[str, object]:
         return {
@@ -29,6 +31,19 @@ class FileReport:
         }
 
 
+@dataclass
+class DiscoveryStats:
+    discovered: int = 0
+    skipped: int = 0
+
+
+@dataclass
+class LineEdit:
+    line: int
+    before: str
+    after: str | None = None
+
+
 @dataclass
 class RewriteResult:
     path: str
@@ -36,4 +51,7 @@ class RewriteResult:
     original: str
     rewritten: str
     change_count: int
+    edits: list[LineEdit] = field(default_factory=list)
+    stale: bool = False
+    error: str | None = None
 
@@ -1,33 +1,104 @@
 from __future__ import annotations
 
 import io
+import os
+import secrets
+import stat
+import tempfile
 import tokenize
+from collections.abc import Iterator
 from pathlib import Path
 
-from .models import RewriteResult
+from .models import LineEdit, RewriteResult
 from .rules import LOW_SIGNAL_COMMENT_PATTERNS
 
 
 def rewrite_file(path: Path, apply: bool = False) -> RewriteResult:
+    mtime_ns = path.stat().st_mtime_ns
     original = path.read_text(encoding="utf-8", errors="ignore")
-    rewritten, change_count = rewrite_text(original, suffix=path.suffix.lower())
+    rewritten, change_count, edits = rewrite_text_with_edits(original, suffix=path.suffix.lower())
     changed = rewritten != original
+    stale = False
     if apply and changed:
-        path.write_text(rewritten, encoding="utf-8")
+        stale = not write_text_atomic(path, rewritten, expected_mtime_ns=mtime_ns)
     return RewriteResult(
         path=str(path),
         changed=changed,
         original=original,
         rewritten=rewritten,
         change_count=change_count,
+        edits=edits,
+        stale=stale,
     )
 
 
+def write_text_atomic(path: Path, text: str, expected_mtime_ns: int | None = None) -> bool:
+    """Replace ``path`` with ``text`` via a temp file, keeping its permission bits.
+
+    Returns False without touching ``path`` when its mtime no longer equals
+    ``expected_mtime_ns``, i.e. something else wrote it since it was read.
+    A symlink is written through to its target rather than replaced.
+    """
+    path = Path(os.path.realpath(path))
+    try:
+        mode: int | None = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = None
+    fd, temp_name = _create_temp_file(path)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(text)
+            handle.flush()
+            os.fsync(handle.fileno())
+        if mode is not None:
+            os.chmod(temp_name, mode)
+        if expected_mtime_ns is not None and _mtime_ns(path) != expected_mtime_ns:
+            os.unlink(temp_name)
+            return False
+        os.replace(temp_name, path)
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.unlink(temp_name)
+        raise
+    return True
+
+
+def _create_temp_file(path: Path) -> tuple[int, str]:
+    # Unlike mkstemp's fixed 0600, 0o666 lets the kernel apply the umask, so a
+    # new file gets what open() would give it without touching the process umask.
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    for _ in range(tempfile.TMP_MAX):
+        temp_name = os.path.join(path.parent, f".{path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            return os.open(temp_name, flags, 0o666), temp_name
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"no free temporary file name next to {path}")
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
 def rewrite_text(text: str, suffix: str = "") -> tuple[str, int]:
+    rewritten, changes, _ = rewrite_text_with_edits(text, suffix=suffix)
+    return rewritten, changes
+
+
+def rewrite_text_with_edits(text: str, suffix: str = "") -> tuple[str, int, list[LineEdit]]:
+    """Rewrite ``text`` and also return one edit per touched line, in line order.
+
+    An edit with ``after=None`` is a dropped line; otherwise the line was trimmed.
+    """
     lines = text.splitlines()
     output: list[str] = []
+    edits: list[LineEdit] = []
     changes = 0
     blank_run = 0
+    last_kept = 0
     removable_comment_lines = _python_low_signal_comment_lines(text) if suffix == ".py" else set()
 
     for index, line in enumerate(lines, start=1):
@@ -37,30 +108,118 @@ def rewrite_text(text: str, suffix: str = "") -> tuple[str, int]:
 
         if index in removable_comment_lines:
             changes += 1
+            edits.append(LineEdit(line=index, before=line))
             continue
 
         if trimmed == "":
             blank_run += 1
             if blank_run > 2:
                 changes += 1
+                edits.append(LineEdit(line=index, before=line))
                 continue
         else:
             blank_run = 0
 
+        if trimmed != line:
+            edits.append(LineEdit(line=index, before=line, after=trimmed))
         output.append(trimmed)
+        last_kept = index
 
     rewritten = "\n".join(output)
-    if text.endswith("\n"):
+    if output and text.endswith("\n"):
         rewritten += "\n"
-    return rewritten, changes
+    elif output and output[-1] == "":
+        # Joining leaves a bare trailing newline, so the last kept line is gone.
+        _mark_dropped(edits, last_kept, lines[last_kept - 1])
+    return rewritten, changes, edits
+
+
+def _mark_dropped(edits: list[LineEdit], line: int, before: str) -> None:
+    position = len(edits)
+    while position and edits[position - 1].line > line:
+        position -= 1
+    if position and edits[position - 1].line == line:
+        edits[position - 1].after = None
+    else:
+        edits.insert(position, LineEdit(line=line, before=before))
+
+
+def unified_diff(
+    original: str,
+    edits: list[LineEdit],
+    fromfile: str = "",
+    tofile: str = "",
+    context: int = 3,
+) -> Iterator[str]:
+    """Yield unified-diff lines built directly from ``edits``.
+
+    The format follows ``difflib.unified_diff(..., lineterm="")``, but no
+    sequence matching happens, so the cost is linear in the file length.
+    """
+    if not edits:
+        return
+    lines = original.splitlines()
+    yield f"--- {fromfile}"
+    yield f"+++ {tofile}"
+
+    hunk: list[LineEdit] = [edits[0]]
+    dropped_before_hunk = 0
+    for edit in edits[1:]:
+        if edit.line - hunk[-1].line - 1 > 2 * context:
+            yield from _format_hunk(lines, hunk, dropped_before_hunk, context)
+            dropped_before_hunk += _count_dropped(hunk)
+            hunk = [edit]
+        else:
+            hunk.append(edit)
+    yield from _format_hunk(lines, hunk, dropped_before_hunk, context)
+
+
+def _count_dropped(edits: list[LineEdit]) -> int:
+    return sum(1 for edit in edits if edit.after is None)
+
+
+def _format_hunk(lines: list[str], hunk: list[LineEdit], dropped_before: int, context: int) -> Iterator[str]:
+    first = max(1, hunk[0].line - context)
+    last = min(len(lines), hunk[-1].line + context)
+    old_length = last - first + 1
+    new_length = old_length - _count_dropped(hunk)
+    new_first = first - dropped_before
+    yield f"@@ -{_format_range(first, old_length)} +{_format_range(new_first, new_length)} @@"
+
+    line_number = first
+    index = 0
+    while line_number <= last:
+        if index < len(hunk) and hunk[index].line == line_number:
+            run: list[LineEdit] = []
+            while index < len(hunk) and hunk[index].line == line_number:
+                run.append(hunk[index])
+                index += 1
+                line_number += 1
+            for edit in run:
+                yield f"-{edit.before}"
+            for edit in run:
+                if edit.after is not None:
+                    yield f"+{edit.after}"
+            continue
+        yield f" {lines[line_number - 1]}"
+        line_number += 1
+
+
+def _format_range(start: int, length: int) -> str:
+    if length == 1:
+        return str(start)
+    if length == 0:
+        start -= 1
+    return f"{start},{length}"
 
 
 def _python_low_signal_comment_lines(text: str) -> set[int]:
     lines = text.splitlines()
     removable: set[int] = set()
+    # generate_tokens is lazy: errors surface while iterating, not when it is called.
     try:
-        tokens = tokenize.generate_tokens(io.StringIO(text).readline)
-    except tokenize.TokenError:
+        tokens = list(tokenize.generate_tokens(io.StringIO(text).readline))
+    except (tokenize.TokenError, SyntaxError):
         return removable
 
     for token in tokens:
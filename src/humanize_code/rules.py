@@ -9,6 +9,8 @@ SEVERITY_WEIGHT: dict[str, int] = {
     "low": 4,
 }
 
+MAX_SCORE = 100
+
 SEVERITY_ORDER: dict[str, int] = {
     "critical": 4,
     "high": 3,
@@ -81,3 +83,20 @@ PY_FUNC_OR_CLASS_PATTERN = re.compile(r"^\s*(def|class)\s+([A-Za-z_][A-Za-z0-9_]
 JS_FUNC_PATTERN = re.compile(
     r"^\s*(?:function\s+([A-Za-z_][A-Za-z0-9_]*)|\bconst\s+([A-Za-z_][A-Za-z0-9_]*)\s*=\s*\()"
 )
+
+# Variants of the line rules above for a buffer of many joined lines. [^\S\n] stands in
+# for \s so a match never spans a newline.
+TODO_COMMENT_MULTILINE_PATTERN = re.compile(
+    r"^[^\S\n]*(#|//|/\*)[^\S\n]*(TODO|FIXME|XXX)\b", re.IGNORECASE | re.MULTILINE
+)
+PY_BARE_EXCEPT_MULTILINE_PATTERN = re.compile(r"^[^\S\n]*except[^\S\n]*:[^\S\n]*$", re.MULTILINE)
+PY_BROAD_EXCEPT_MULTILINE_PATTERN = re.compile(
+    r"^[^\S\n]*except[^\S\n]+Exception(?:[^\S\n]+as[^\S\n]+\w+)?[^\S\n]*:[^\S\n]*$", re.MULTILINE
+)
+PY_FUNC_OR_CLASS_MULTILINE_PATTERN = re.compile(
+    r"^[^\S\n]*(def|class)[^\S\n]+([A-Za-z_][A-Za-z0-9_]*)\b", re.MULTILINE
+)
+JS_FUNC_MULTILINE_PATTERN = re.compile(
+    r"^[^\S\n]*(?:function[^\S\n]+([A-Za-z_][A-Za-z0-9_]*)|\bconst[^\S\n]+([A-Za-z_][A-Za-z0-9_]*)[^\S\n]*=[^\S\n]*\()",
+    re.MULTILINE,
+)
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import math
+import random
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .models import FileReport
+from .rules import MAX_SCORE, SEVERITY_ORDER
+
+Z_95 = 1.959963984540054
+
+StratumKey = tuple[str, str]
+
+
+@dataclass
+class Estimate:
+    value: float
+    ci_low: float
+    ci_high: float
+
+    def to_dict(self) -> dict[str, float]:
+        return {
+            "estimate": round(self.value, 4),
+            "ci95_low": round(self.ci_low, 4),
+            "ci95_high": round(self.ci_high, 4),
+        }
+
+
+@dataclass
+class SampleDesign:
+    seed: int
+    population: dict[StratumKey, list[Path]]
+    sample: dict[StratumKey, list[Path]] = field(default_factory=dict)
+
+    @property
+    def population_size(self) -> int:
+        return sum(len(files) for files in self.population.values())
+
+    @property
+    def files(self) -> list[Path]:
+        return sorted(path for chosen in self.sample.values() for path in chosen)
+
+    def estimate_mean(self, values: dict[Path, float], upper: float = math.inf) -> Estimate:
+        """Stratified mean of a per-file value with a normal 95% interval.
+
+        Strata with a single sampled file borrow the pooled sample variance,
+        since their own variance is undefined. The interval is clipped to
+        ``[0, upper]``, the range the value can actually take.
+        """
+        total = self.population_size
+        if not total:
+            return Estimate(0.0, 0.0, 0.0)
+        pooled = _variance([values[path] for chosen in self.sample.values() for path in chosen])
+        mean = 0.0
+        variance = 0.0
+        for key, chosen in self.sample.items():
+            if not chosen:
+                continue
+            observed = [values[path] for path in chosen]
+            weight = len(self.population[key]) / total
+            stratum_variance = _variance(observed) if len(observed) > 1 else pooled
+            finite_correction = 1 - len(observed) / len(self.population[key])
+            mean += weight * sum(observed) / len(observed)
+            variance += weight**2 * finite_correction * stratum_variance / len(observed)
+        margin = Z_95 * math.sqrt(variance)
+        return Estimate(mean, max(0.0, mean - margin), min(upper, mean + margin))
+
+
+def parse_sample_spec(spec: str) -> float | int:
+    """``"200"`` is a file count; ``"5%"`` is a fraction of discovered files."""
+    text = spec.strip()
+    if text.endswith("%"):
+        percent = float(text[:-1])
+        if not 0 < percent <= 100:
+            raise ValueError(f"sample percentage must be in (0, 100], got {spec}")
+        return percent / 100
+    count = int(text)
+    if count < 1:
+        raise ValueError(f"sample size must be at least 1, got {spec}")
+    return count
+
+
+def stratified_sample(files: list[Path], spec: float | int, seed: int = 0) -> SampleDesign:
+    """Draw a reproducible sample stratified by directory and extension.
+
+    Each stratum gets at least one file and the rest is allocated in
+    proportion to stratum size. When the sample is smaller than the number
+    of strata, strata collapse to extension only, then to a single stratum.
+    """
+    size = spec if isinstance(spec, int) else math.ceil(spec * len(files))
+    size = min(size, len(files))
+    for key_of in (_directory_and_extension, _extension_only, _everything):
+        population = _group(files, key_of)
+        if len(population) <= size:
+            break
+
+    rng = random.Random(seed)
+    allocation = _allocate(population, size)
+    sample = {key: sorted(rng.sample(population[key], count)) for key, count in allocation.items()}
+    return SampleDesign(seed=seed, population=population, sample=sample)
+
+
+def estimate_scan(design: SampleDesign, reports: list[FileReport]) -> dict[str, object]:
+    by_path = {Path(report.path): report for report in reports}
+    sampled = design.files
+    severities = sorted(SEVERITY_ORDER, key=lambda severity: SEVERITY_ORDER[severity], reverse=True)
+
+    scores = {path: float(by_path[path].score) for path in sampled}
+    flagged = {path: float(bool(by_path[path].issues)) for path in sampled}
+    issues_per_file: dict[str, dict[str, float]] = {}
+    for severity in severities:
+        counts = {
+            path: float(sum(1 for issue in by_path[path].issues if issue.severity == severity)) for path in sampled
+        }
+        issues_per_file[severity] = design.estimate_mean(counts).to_dict()
+
+    return {
+        "mean_score": design.estimate_mean(scores, upper=MAX_SCORE).to_dict(),
+        "flagged_file_ratio": design.estimate_mean(flagged, upper=1.0).to_dict(),
+        "issues_per_file": issues_per_file,
+    }
+
+
+def _allocate(population: dict[StratumKey, list[Path]], size: int) -> dict[StratumKey, int]:
+    total = sum(len(files) for files in population.values())
+    if not size:
+        return {}
+    shares = {key: size * len(files) / total for key, files in population.items()}
+    allocation = {key: min(len(population[key]), max(1, math.floor(share))) for key, share in shares.items()}
+
+    # Settle the rounding one file at a time, by largest remainder.
+    excess = sum(allocation.values()) - size
+    while excess > 0:
+        shrinkable = [key for key in allocation if allocation[key] > 1]
+        key = min(shrinkable, key=lambda key: (shares[key] - allocation[key], key))
+        allocation[key] -= 1
+        excess -= 1
+    while excess < 0:
+        growable = [key for key in allocation if allocation[key] < len(population[key])]
+        key = min(growable, key=lambda key: (allocation[key] - shares[key], key))
+        allocation[key] += 1
+        excess += 1
+    return allocation
+
+
+def _group(files: list[Path], key_of: Callable[[Path], StratumKey]) -> dict[StratumKey, list[Path]]:
+    groups: defaultdict[StratumKey, list[Path]] = defaultdict(list)
+    for path in files:
+        groups[key_of(path)].append(path)
+    return dict(groups)
+
+
+def _directory_and_extension(path: Path) -> StratumKey:
+    return (str(path.parent), path.suffix.lower())
+
+
+def _extension_only(path: Path) -> StratumKey:
+    return ("*", path.suffix.lower())
+
+
+def _everything(path: Path) -> StratumKey:
+    return ("*", "*")
+
+
+def _variance(values: list[float]) -> float:
+    if len(values) < 2:
+        return 0.0
+    mean = sum(values) / len(values)
+    return sum((value - mean) ** 2 for value in values) / (len(values) - 1)
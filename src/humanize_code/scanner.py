@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from .analyzer import (
+    BATCH_MAX_FILES,
+    analyze_text,
+    analyze_texts,
+    calculate_score,
+    discover_source_files,
+    normalize_discovery_config,
+)
+from .models import FileReport, Issue
+from .rewriter import rewrite_text_with_edits
+
+CacheKey = tuple[bytes, str]
+
+
+@dataclass
+class LatencyStats:
+    calls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, float]:
+        return {
+            "calls": self.calls,
+            "total_seconds": self.total_seconds,
+            "mean_seconds": self.total_seconds / self.calls if self.calls else 0.0,
+            "max_seconds": self.max_seconds,
+        }
+
+
+class Scanner:
+    """Reusable analyzer for long-running processes.
+
+    Configuration is normalized once at construction. Methods are safe to
+    call from several threads: analysis itself is stateless, and the result
+    cache and latency counters sit behind one lock. Results are cached by
+    content hash and suffix, so unchanged files are not re-analyzed.
+    """
+
+    def __init__(
+        self,
+        extensions: set[str] | None = None,
+        include_tests: bool = False,
+        excluded_dirs: set[str] | None = None,
+        cache_size: int = 1024,
+    ) -> None:
+        exts, skip_dirs = normalize_discovery_config(extensions, excluded_dirs)
+        self.extensions = frozenset(exts)
+        self.excluded_dirs = frozenset(skip_dirs)
+        self.include_tests = include_tests
+        self.cache_size = cache_size
+        self._cache: OrderedDict[CacheKey, tuple[Issue, ...]] = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._latency: dict[str, LatencyStats] = {}
+        self._lock = threading.Lock()
+
+    def discover(self, paths: Iterable[Path | str]) -> list[Path]:
+        return discover_source_files(
+            [Path(path) for path in paths],
+            set(self.extensions),
+            set(self.excluded_dirs),
+            include_tests=self.include_tests,
+        )
+
+    def scan_paths(self, paths: Iterable[Path | str]) -> list[FileReport]:
+        """Analyze every source file under ``paths``; reports come back sorted by path."""
+        with self._timed("scan_paths"):
+            files = self.discover(paths)
+            reports: list[FileReport] = []
+            for start in range(0, len(files), BATCH_MAX_FILES):
+                chunk = files[start : start + BATCH_MAX_FILES]
+                texts = [path.read_text(encoding="utf-8", errors="ignore") for path in chunk]
+                suffixes = [path.suffix.lower() for path in chunk]
+                for path, issues in zip(chunk, self._analyze_many(texts, suffixes)):
+                    reports.append(FileReport(path=str(path), score=calculate_score(issues), issues=issues))
+            return reports
+
+    def scan_text(self, text: str, suffix: str = "", path: str = "<text>") -> FileReport:
+        with self._timed("scan_text"):
+            issues = self._analyze_many([text], [suffix.lower()])[0]
+            return FileReport(path=path, score=calculate_score(issues), issues=issues)
+
+    def rewrite_text(self, text: str, suffix: str = "") -> tuple[str, int]:
+        with self._timed("rewrite_text"):
+            rewritten, changes, _ = rewrite_text_with_edits(text, suffix=suffix.lower())
+            return rewritten, changes
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "cache": {
+                    "size": len(self._cache),
+                    "capacity": self.cache_size,
+                    "hits": self._cache_hits,
+                    "misses": self._cache_misses,
+                },
+                "latency": {name: stats.to_dict() for name, stats in self._latency.items()},
+            }
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def _analyze_many(self, texts: list[str], suffixes: list[str]) -> list[list[Issue]]:
+        keys = [_content_key(text, suffix) for text, suffix in zip(texts, suffixes)]
+        results: list[list[Issue] | None] = [None] * len(texts)
+        with self._lock:
+            for index, key in enumerate(keys):
+                cached = self._cache.get(key)
+                if cached is None:
+                    continue
+                self._cache.move_to_end(key)
+                results[index] = _copy_issues(cached)
+            hits = sum(1 for result in results if result is not None)
+            self._cache_hits += hits
+            self._cache_misses += len(texts) - hits
+
+        missing = [index for index, result in enumerate(results) if result is None]
+        if len(missing) == 1:
+            fresh = [analyze_text(texts[missing[0]], suffix=suffixes[missing[0]])]
+        else:
+            fresh = analyze_texts([(texts[index], suffixes[index]) for index in missing])
+
+        with self._lock:
+            for index, issues in zip(missing, fresh):
+                results[index] = issues
+                if self.cache_size > 0:
+                    self._cache[keys[index]] = tuple(_copy_issues(issues))
+                    self._cache.move_to_end(keys[index])
+            while len(self._cache) > max(self.cache_size, 0):
+                self._cache.popitem(last=False)
+        return results
+
+    @contextmanager
+    def _timed(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                stats = self._latency.setdefault(name, LatencyStats())
+                stats.calls += 1
+                stats.total_seconds += elapsed
+                stats.max_seconds = max(stats.max_seconds, elapsed)
+
+
+def _content_key(text: str, suffix: str) -> CacheKey:
+    digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    return digest, suffix
+
+
+def _copy_issues(issues: Iterable[Issue]) -> list[Issue]:
+    # Callers may mutate what they get back; the cached copies must stay intact.
+    return [replace(issue) for issue in issues]
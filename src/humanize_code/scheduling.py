@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import json
+import math
+import time
+from pathlib import Path
+
+from .rules import MAX_SCORE
+
+RECENCY_HALF_LIFE_DAYS = 7.0
+PRIOR_SCORE_WEIGHT = 2.0
+
+
+def load_prior_scores(path: Path) -> dict[str, int]:
+    """Read per-file scores from a previous ``scan --json`` report, keyed by resolved path.
+
+    Raises ``OSError`` if the file cannot be read and ``ValueError`` if it is
+    not a scan report.
+    """
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    reports = payload.get("reports") if isinstance(payload, dict) else None
+    if not isinstance(reports, list):
+        raise ValueError("expected a 'scan --json' report with a 'reports' list")
+    scores: dict[str, int] = {}
+    for report in reports:
+        try:
+            scores[str(Path(report["path"]).resolve())] = int(report["score"])
+        except (KeyError, TypeError, ValueError) as error:
+            raise ValueError(f"malformed report entry {report!r}") from error
+    return scores
+
+
+def order_by_risk(files: list[Path], prior_scores: dict[str, int] | None = None) -> list[Path]:
+    """Sort ``files`` so the ones most likely to carry issues come first.
+
+    The estimate only costs a ``stat`` per file: recently modified and large
+    files rank higher, and a high score from a prior run outweighs both.
+    """
+    prior_scores = prior_scores or {}
+    now = time.time()
+    ranked: list[tuple[float, str, Path]] = []
+    for path in files:
+        try:
+            info = path.stat()
+        except OSError:
+            ranked.append((0.0, str(path), path))
+            continue
+        age_days = max(0.0, now - info.st_mtime) / 86400
+        recency = 0.5 ** (age_days / RECENCY_HALF_LIFE_DAYS)
+        size = min(1.0, math.log2(1 + info.st_size) / 20)
+        prior = prior_scores.get(str(path.resolve()), 0) / MAX_SCORE if prior_scores else 0.0
+        risk = PRIOR_SCORE_WEIGHT * prior + recency + size
+        ranked.append((-risk, str(path), path))
+    ranked.sort(key=lambda item: (item[0], item[1]))
+    return [path for _, _, path in ranked]
@@ -1,4 +1,6 @@
-from humanize_code.analyzer import analyze_text
+from pathlib import Path
+
+from humanize_code.analyzer import analyze_file, analyze_text, analyze_texts, iter_file_reports
 
 
 def test_detects_generic_name_and_broad_except() -> None:
@@ -27,3 +29,37 @@ def compute():
     assert "LOW_SIGNAL_COMMENT" in codes
     assert "TODO_MARKER" in codes
 
+
+def test_batched_analysis_matches_per_file_analysis() -> None:
+    items = [
+        ("def helper():\n    try:\n        pass\n    except:\n        pass\n", ".py"),
+        ("", ".py"),
+        ("function util() {\n  // TODO: split\n}", ".js"),
+        ("# FIXME\nclass Manager:\n    pass\nexcept Exception as error:\n", ".py"),
+        ("except:\r\n# TODO\r\n", ".py"),
+        ("/* XXX */ int main() { return 0; }\n", ".c"),
+    ]
+    assert analyze_texts(items) == [analyze_text(text, suffix=suffix) for text, suffix in items]
+
+
+def test_iter_file_reports_keeps_input_order(tmp_path: Path) -> None:
+    small = tmp_path / "b_small.py"
+    large = tmp_path / "a_large.py"
+    small.write_text("# TODO: small\n", encoding="utf-8")
+    large.write_text("# TODO: large\n" + "x = 1\n" * 1000, encoding="utf-8")
+
+    reports = list(iter_file_reports([small, large]))
+
+    assert [report.path for report in reports] == [str(small), str(large)]
+    assert [report.issues[0].code for report in reports] == ["TODO_MARKER", "TODO_MARKER"]
+    assert [report.size for report in reports] == [small.stat().st_size, large.stat().st_size]
+
+
+def test_analyze_file_reads_crlf_like_read_text(tmp_path: Path) -> None:
+    path = tmp_path / "windows.py"
+    path.write_bytes(b"def data():\r\n    # TODO: rename\r\n    return 1\r\n")
+
+    report = analyze_file(path)
+
+    assert report.issues == analyze_text(path.read_text(encoding="utf-8"), suffix=".py")
+    assert report.size == len(path.read_bytes())
@@ -0,0 +1,35 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from humanize_code.cli import main
+
+BARE_EXCEPT = "try:\n    pass\nexcept:\n    pass\n"
+
+
+def test_fail_fast_stops_at_first_gating_issue(tmp_path: Path, capsys) -> None:
+    (tmp_path / "bad.py").write_text(BARE_EXCEPT, encoding="utf-8")
+    (tmp_path / "worse.py").write_text(BARE_EXCEPT, encoding="utf-8")
+
+    exit_code = main(["scan", str(tmp_path), "--json", "--fail-on", "high", "--fail-fast"])
+
+    payload = json.loads(capsys.readouterr().out)
+    assert exit_code == 2
+    assert payload["file_count"] == 1
+    assert payload["finding"]["code"] == "BARE_EXCEPT"
+    assert payload["finding"]["line"] == 3
+
+
+def test_fail_fast_passes_when_nothing_reaches_threshold(tmp_path: Path, capsys) -> None:
+    (tmp_path / "calm.py").write_text("# TODO: later\nvalue = 1\n", encoding="utf-8")
+
+    exit_code = main(["scan", str(tmp_path), "--fail-on", "high", "--fail-fast"])
+
+    assert exit_code == 0
+    assert "No issues at or above high." in capsys.readouterr().out
+
+
+def test_fail_fast_requires_fail_on(tmp_path: Path) -> None:
+    with pytest.raises(SystemExit):
+        main(["scan", str(tmp_path), "--fail-fast"])
@@ -0,0 +1,65 @@
+import json
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from humanize_code.cli import main
+from humanize_code.metrics import ScanMetrics, render_openmetrics, write_metrics
+from humanize_code.models import FileReport, Issue
+
+
+def test_openmetrics_histogram_is_cumulative() -> None:
+    metrics = ScanMetrics()
+    metrics.record_report(FileReport(path="a.py", score=0), size=10)
+    issue = Issue(code="BARE_EXCEPT", severity="high", message="bare")
+    metrics.record_report(FileReport(path="b.py", score=15, issues=[issue]), size=20)
+
+    text = render_openmetrics(metrics)
+
+    assert 'code_humanizer_file_score_bucket{le="0.0"} 1' in text
+    assert 'code_humanizer_file_score_bucket{le="25.0"} 2' in text
+    assert "code_humanizer_file_score_sum 15" in text
+    assert 'code_humanizer_issues_by_severity{severity="high"} 1' in text
+    assert "code_humanizer_read_bytes 30" in text
+    assert text.endswith("# EOF\n")
+
+
+def test_scan_writes_json_metrics(tmp_path: Path) -> None:
+    source = tmp_path / "pkg" / "logic.py"
+    skipped = tmp_path / "tests" / "test_logic.py"
+    source.parent.mkdir()
+    skipped.parent.mkdir()
+    source.write_text("def helper():\n    # TODO: name this\n    return 1\n", encoding="utf-8")
+    skipped.write_text("value = 1\n", encoding="utf-8")
+    metrics_path = tmp_path / "metrics.json"
+
+    assert main(["scan", str(tmp_path), "--json", "--metrics-out", str(metrics_path)]) == 0
+
+    payload = json.loads(metrics_path.read_text(encoding="utf-8"))
+    assert payload["files"] == {"discovered": 2, "skipped": 1, "analyzed": 1, "flagged": 1}
+    assert payload["issues_by_code"] == {"GENERIC_NAME": 1, "TODO_MARKER": 1}
+    assert payload["bytes_read"] == source.stat().st_size
+    assert set(payload["phase_seconds"]) == {"discover", "analyze", "report"}
+
+
+def test_new_metrics_file_is_readable_by_other_users(tmp_path: Path) -> None:
+    metrics_path = tmp_path / "code_humanizer.prom"
+    previous = os.umask(0o022)
+    try:
+        write_metrics(ScanMetrics(), metrics_path)
+    finally:
+        os.umask(previous)
+
+    assert stat.S_IMODE(metrics_path.stat().st_mode) == 0o644
+
+
+@pytest.mark.parametrize("extra", [[], ["--fail-fast"]])
+def test_unwritable_metrics_keeps_the_gating_exit_code(tmp_path: Path, capsys, extra: list[str]) -> None:
+    (tmp_path / "logic.py").write_text("# TODO: name this\nvalue = 1\n", encoding="utf-8")
+    metrics_path = tmp_path / "missing" / "metrics.prom"
+
+    assert main(["scan", str(tmp_path), "--fail-on", "low", "--metrics-out", str(metrics_path), *extra]) == 2
+
+    assert f"cannot write --metrics-out {metrics_path}" in capsys.readouterr().err
@@ -0,0 +1,98 @@
+import re
+from pathlib import Path
+
+from humanize_code import cli, rewriter
+from humanize_code.cli import main
+
+
+def _make_tree(root: Path) -> None:
+    for index in range(12):
+        (root / f"mod{index:02d}.py").write_text(f"value = {index}   \n\n\n\n\nnext = 1\n", encoding="utf-8")
+    (root / "clean.py").write_text("value = 1\n", encoding="utf-8")
+
+
+def _without_summary(output: str) -> list[str]:
+    return output.splitlines()[:-1]
+
+
+def test_parallel_apply_matches_serial_preview_order(tmp_path: Path, capsys) -> None:
+    _make_tree(tmp_path)
+    assert main(["rewrite", str(tmp_path), "--diff"]) == 0
+    serial = capsys.readouterr().out
+
+    assert main(["rewrite", str(tmp_path), "--apply", "--jobs", "2", "--diff"]) == 0
+    parallel = capsys.readouterr().out
+
+    assert _without_summary(parallel) == [line.replace("[preview]", "[applied]") for line in _without_summary(serial)]
+    applied = [line.split()[1] for line in parallel.splitlines() if line.startswith("[applied]")]
+    assert applied == sorted(applied) and len(applied) == 12
+    assert re.match(
+        r"Rewrote 12/13 files \(36 safe changes\) in [\d.]+s: [\d.]+ files/s, [\d.]+ changes/s$",
+        parallel.splitlines()[-1],
+    )
+    assert (tmp_path / "mod03.py").read_text(encoding="utf-8") == "value = 3\n\n\nnext = 1\n"
+
+
+def test_rewrite_reports_file_modified_during_rewrite(tmp_path: Path, capsys, monkeypatch) -> None:
+    target = tmp_path / "module.py"
+    target.write_text("x = 1   \n", encoding="utf-8")
+    monkeypatch.setattr(rewriter, "_mtime_ns", lambda path: -1)
+
+    assert main(["rewrite", str(tmp_path), "--apply"]) == 0
+
+    output = capsys.readouterr().out
+    assert f"[skipped] {target} (modified since it was read)" in output
+    assert output.splitlines()[-1].endswith("; skipped 1 modified during rewrite")
+    assert target.read_text(encoding="utf-8") == "x = 1   \n"
+
+
+def test_rewrite_reports_unreadable_file_and_continues(tmp_path: Path, capsys, monkeypatch) -> None:
+    _make_tree(tmp_path)
+    broken = tmp_path / "mod00.py"
+    original_rewrite_file = cli.rewrite_file
+
+    def flaky_rewrite_file(path: Path, apply: bool = False):
+        if path == broken:
+            raise PermissionError("permission denied")
+        return original_rewrite_file(path, apply=apply)
+
+    monkeypatch.setattr(cli, "rewrite_file", flaky_rewrite_file)
+
+    assert main(["rewrite", str(tmp_path), "--apply"]) == 1
+
+    output = capsys.readouterr().out
+    assert f"[error] {broken} (permission denied)" in output
+    assert output.count("[applied]") == 11
+    assert output.splitlines()[-1].endswith("; 1 failed")
+
+
+def test_parallel_rewrite_reports_untokenizable_file(tmp_path: Path, capsys) -> None:
+    _make_tree(tmp_path)
+    broken = tmp_path / "mod05.py"
+    broken.write_text("# Initialize the value\nx = (1,   \n", encoding="utf-8")
+
+    assert main(["rewrite", str(tmp_path), "--apply", "--jobs", "4"]) == 0
+
+    output = capsys.readouterr().out
+    assert f"[applied] {broken} (1 safe changes)" in output
+    assert output.count("[applied]") == 12
+    assert broken.read_text(encoding="utf-8") == "# Initialize the value\nx = (1,\n"
+
+
+def test_rewrite_reports_unexpected_error_per_file(tmp_path: Path, capsys, monkeypatch) -> None:
+    _make_tree(tmp_path)
+    broken = tmp_path / "mod00.py"
+    original_rewrite_file = cli.rewrite_file
+
+    def failing_rewrite_file(path: Path, apply: bool = False):
+        if path == broken:
+            raise RuntimeError("boom")
+        return original_rewrite_file(path, apply=apply)
+
+    monkeypatch.setattr(cli, "rewrite_file", failing_rewrite_file)
+
+    assert main(["rewrite", str(tmp_path), "--apply"]) == 1
+
+    output = capsys.readouterr().out
+    assert f"[error] {broken} (RuntimeError: boom)" in output
+    assert output.count("[applied]") == 11
@@ -1,4 +1,16 @@
-from humanize_code.rewriter import rewrite_text
+import difflib
+import os
+import stat
+from pathlib import Path
+
+from humanize_code.cli import main
+from humanize_code.rewriter import (
+    rewrite_file,
+    rewrite_text,
+    rewrite_text_with_edits,
+    unified_diff,
+    write_text_atomic,
+)
 
 
 def test_rewriter_removes_low_signal_comment() -> None:
@@ -21,3 +33,69 @@ def test_rewriter_keeps_hash_inside_python_string_literal() -> None:
     original = 'sample = """\\n# This function returns x\\nvalue\\n"""\\n'
     rewritten, _ = rewrite_text(original, suffix=".py")
     assert "# This function returns x" in rewritten
+
+
+def test_rewriter_reports_line_edits() -> None:
+    original = "x = 1  \n# This function returns x\ny = 2\n"
+    _, _, edits = rewrite_text_with_edits(original, suffix=".py")
+    assert [(edit.line, edit.after) for edit in edits] == [(1, "x = 1"), (2, None)]
+
+
+def test_unified_diff_from_edits_matches_difflib() -> None:
+    original = "".join(f"line{index}\n" for index in range(20))
+    original = original.replace("line2\n", "line2   \n").replace("line15\n", "# Returns x\n")
+    rewritten, _, edits = rewrite_text_with_edits(original, suffix=".py")
+    expected = difflib.unified_diff(
+        original.splitlines(), rewritten.splitlines(), fromfile="a", tofile="b", lineterm=""
+    )
+    assert list(unified_diff(original, edits, fromfile="a", tofile="b")) == list(expected)
+
+
+def test_rewrite_file_apply_preserves_mode(tmp_path: Path) -> None:
+    target = tmp_path / "module.py"
+    target.write_text("x = 1   \n", encoding="utf-8")
+    target.chmod(0o640)
+    result = rewrite_file(target, apply=True)
+    assert result.changed and not result.stale
+    assert target.read_text(encoding="utf-8") == "x = 1\n"
+    assert stat.S_IMODE(target.stat().st_mode) == 0o640
+    assert [item.name for item in tmp_path.iterdir()] == ["module.py"]
+
+
+def test_write_text_atomic_skips_file_modified_since_read(tmp_path: Path) -> None:
+    target = tmp_path / "module.py"
+    target.write_text("x = 1\n", encoding="utf-8")
+    stale_mtime = target.stat().st_mtime_ns - 1
+    assert not write_text_atomic(target, "x = 2\n", expected_mtime_ns=stale_mtime)
+    assert target.read_text(encoding="utf-8") == "x = 1\n"
+    assert [item.name for item in tmp_path.iterdir()] == ["module.py"]
+
+
+def test_rewrite_apply_writes_through_symlinks(tmp_path: Path, capsys) -> None:
+    real = tmp_path / "real" / "module.py"
+    link = tmp_path / "link" / "module.py"
+    real.parent.mkdir()
+    link.parent.mkdir()
+    real.write_text("x = 1   \n", encoding="utf-8")
+    link.symlink_to(real)
+
+    assert main(["rewrite", str(tmp_path), "--apply", "--jobs", "2"]) == 0
+
+    output = capsys.readouterr().out
+    assert link.is_symlink()
+    assert real.read_text(encoding="utf-8") == "x = 1\n"
+    assert "[skipped]" not in output
+    assert output.count("[applied]") == 1
+
+
+def test_write_text_atomic_leaves_process_umask_alone(tmp_path: Path, monkeypatch) -> None:
+    def forbidden(mask: int) -> int:
+        raise AssertionError("umask changed")
+
+    monkeypatch.setattr(os, "umask", forbidden)
+    target = tmp_path / "new.txt"
+
+    assert write_text_atomic(target, "x\n")
+
+    assert target.read_text(encoding="utf-8") == "x\n"
+    assert [path.name for path in tmp_path.iterdir()] == ["new.txt"]
@@ -0,0 +1,68 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from humanize_code.cli import main
+from humanize_code.sampling import SampleDesign, parse_sample_spec, stratified_sample
+
+
+def _make_files(root: Path) -> list[Path]:
+    files = []
+    for directory in ("api", "core", "web"):
+        for index in range(10):
+            suffix = ".js" if directory == "web" else ".py"
+            path = root / directory / f"mod{index}{suffix}"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("value = 1\n", encoding="utf-8")
+            files.append(path)
+    return sorted(files)
+
+
+def test_parse_sample_spec() -> None:
+    assert parse_sample_spec("25") == 25
+    assert parse_sample_spec("5%") == pytest.approx(0.05)
+    with pytest.raises(ValueError):
+        parse_sample_spec("0")
+
+
+def test_stratified_sample_is_seeded_and_covers_every_stratum(tmp_path: Path) -> None:
+    files = _make_files(tmp_path)
+
+    first = stratified_sample(files, 6, seed=7)
+    second = stratified_sample(files, 6, seed=7)
+
+    assert first.files == second.files
+    assert len(first.files) == 6
+    assert {path.parent.name for path in first.files} == {"api", "core", "web"}
+
+
+@pytest.mark.parametrize(("size", "expected"), [(5, [2, 2, 1]), (8, [3, 3, 2]), (3, [1, 1, 1])])
+def test_allocation_follows_stratum_size(tmp_path: Path, size: int, expected: list[int]) -> None:
+    files = [tmp_path / directory / f"mod{index}.py" for directory in ("a", "b", "c") for index in range(100)]
+
+    design = stratified_sample(files, size)
+
+    assert [len(chosen) for _, chosen in sorted(design.sample.items())] == expected
+
+
+def test_full_sample_estimates_are_exact(tmp_path: Path, capsys) -> None:
+    files = _make_files(tmp_path)
+    files[0].write_text("# TODO: remove\nvalue = 1\n", encoding="utf-8")
+
+    assert main(["scan", str(tmp_path), "--json", "--sample", "100%"]) == 0
+
+    payload = json.loads(capsys.readouterr().out)
+    low = payload["estimates"]["issues_per_file"]["low"]
+    assert payload["coverage"]["analyzed_files"] == 30
+    assert low == {"estimate": pytest.approx(1 / 30, abs=1e-4), "ci95_low": low["estimate"], "ci95_high": low["estimate"]}
+
+
+def test_interval_is_clipped_to_the_value_range(tmp_path: Path) -> None:
+    files = [tmp_path / f"mod{index}.py" for index in range(6)]
+    design = SampleDesign(seed=0, population={("*", "*"): files}, sample={("*", "*"): files[:2]})
+
+    estimate = design.estimate_mean({files[0]: 0.0, files[1]: 1.0}, upper=1.0)
+
+    assert estimate.value == pytest.approx(0.5)
+    assert (estimate.ci_low, estimate.ci_high) == (0.0, 1.0)
@@ -0,0 +1,44 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from humanize_code import Scanner
+from humanize_code.analyzer import analyze_file, analyze_text
+
+SAMPLE = "def helper():\n    # TODO: rename\n    return 1\n"
+
+
+def test_scan_text_matches_analyze_text_and_uses_cache() -> None:
+    scanner = Scanner(cache_size=8)
+
+    first = scanner.scan_text(SAMPLE, suffix=".py")
+    first.issues[0].message = "mutated by caller"
+    second = scanner.scan_text(SAMPLE, suffix=".py")
+
+    assert second.issues == analyze_text(SAMPLE, suffix=".py")
+    stats = scanner.stats()
+    assert stats["cache"]["hits"] == 1
+    assert stats["cache"]["misses"] == 1
+    assert stats["latency"]["scan_text"]["calls"] == 2
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    scanner = Scanner(cache_size=2)
+    for text in ("a = 1\n", "b = 2\n", "a = 1\n", "c = 3\n"):
+        scanner.scan_text(text, suffix=".py")
+
+    scanner.scan_text("b = 2\n", suffix=".py")
+
+    assert scanner.stats()["cache"] == {"size": 2, "capacity": 2, "hits": 1, "misses": 4}
+
+
+def test_scan_paths_is_thread_safe(tmp_path: Path) -> None:
+    for index in range(20):
+        (tmp_path / f"mod{index}.py").write_text(SAMPLE + f"value = {index % 3}\n", encoding="utf-8")
+    scanner = Scanner()
+    expected = [analyze_file(path) for path in sorted(tmp_path.glob("*.py"))]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: scanner.scan_paths([tmp_path]), range(8)))
+
+    assert all(reports == expected for reports in results)
+    assert scanner.stats()["latency"]["scan_paths"]["calls"] == 8
@@ -0,0 +1,102 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from humanize_code import analyzer
+from humanize_code.cli import main
+from humanize_code.scheduling import load_prior_scores, order_by_risk
+
+
+def test_order_by_risk_prefers_prior_high_scores(tmp_path: Path) -> None:
+    calm = tmp_path / "calm.py"
+    noisy = tmp_path / "noisy.py"
+    for path in (calm, noisy):
+        path.write_text("value = 1\n", encoding="utf-8")
+        os.utime(path, (0, 0))
+    prior = tmp_path / "prior.json"
+    prior.write_text(json.dumps({"reports": [{"path": str(noisy), "score": 60}]}), encoding="utf-8")
+
+    assert order_by_risk([calm, noisy], load_prior_scores(prior)) == [noisy, calm]
+
+
+def test_order_by_risk_skips_resolve_without_prior_scores(tmp_path: Path, monkeypatch) -> None:
+    files = [tmp_path / "a.py", tmp_path / "b.py"]
+    for path in files:
+        path.write_text("value = 1\n", encoding="utf-8")
+
+    def forbidden(self, strict: bool = False) -> Path:
+        raise AssertionError("resolve() called")
+
+    monkeypatch.setattr(Path, "resolve", forbidden)
+
+    assert sorted(order_by_risk(files)) == files
+
+
+def test_exhausted_time_budget_emits_partial_report(tmp_path: Path, capsys) -> None:
+    source = tmp_path / "logic.py"
+    source.write_text("try:\n    pass\nexcept:\n    pass\n", encoding="utf-8")
+
+    exit_code = main(["scan", str(tmp_path), "--json", "--time-budget", "0", "--fail-on", "high"])
+
+    payload = json.loads(capsys.readouterr().out)
+    assert exit_code == 0
+    assert payload["partial"] is True
+    assert payload["coverage"] == {"analyzed_files": 0, "total_files": 1, "ratio": 0.0}
+    assert payload["unanalyzed_files"] == [str(source)]
+
+
+def test_time_budget_still_gates_on_analyzed_files(tmp_path: Path, capsys) -> None:
+    (tmp_path / "logic.py").write_text("try:\n    pass\nexcept:\n    pass\n", encoding="utf-8")
+
+    exit_code = main(["scan", str(tmp_path), "--json", "--time-budget", "60", "--fail-on", "high"])
+
+    payload = json.loads(capsys.readouterr().out)
+    assert exit_code == 2
+    assert payload["partial"] is False
+
+
+def test_zero_time_budget_analyzes_no_batch(tmp_path: Path, capsys, monkeypatch) -> None:
+    for index in range(300):
+        (tmp_path / f"mod{index}.py").write_text("value = 1\n", encoding="utf-8")
+    analyzed_texts: list[str] = []
+    original = analyzer.analyze_texts
+
+    def counting_analyze_texts(items):
+        analyzed_texts.extend(text for text, _ in items)
+        return original(items)
+
+    monkeypatch.setattr(analyzer, "analyze_texts", counting_analyze_texts)
+
+    assert main(["scan", str(tmp_path), "--json", "--time-budget", "0"]) == 0
+
+    payload = json.loads(capsys.readouterr().out)
+    assert analyzed_texts == []
+    assert payload["coverage"]["analyzed_files"] == 0
+    assert len(payload["unanalyzed_files"]) == 300
+
+
+@pytest.mark.parametrize(
+    ("extra_args", "prior_text"),
+    [
+        (["--time-budget", "-1"], None),
+        (["--time-budget", "nan"], None),
+        (["--time-budget", "inf"], None),
+        (["--prior-report", "{prior}"], '{"reports": []}'),
+        (["--time-budget", "5", "--prior-report", "{prior}"], None),
+        (["--time-budget", "5", "--prior-report", "{prior}"], "not json"),
+        (["--time-budget", "5", "--prior-report", "{prior}"], '{"reports": [{"path": "a.py"}]}'),
+    ],
+)
+def test_invalid_time_budget_inputs_are_usage_errors(tmp_path: Path, capsys, extra_args, prior_text) -> None:
+    prior = tmp_path / "prior.json"
+    if prior_text is not None:
+        prior.write_text(prior_text, encoding="utf-8")
+    args = [item.replace("{prior}", str(prior)) for item in extra_args]
+
+    with pytest.raises(SystemExit) as exit_info:
+        main(["scan", str(tmp_path), *args])
+
+    assert exit_info.value.code == 2
+    assert "error:" in capsys.readouterr().err